@@ -18,6 +18,7 @@ class DynamodbGameRepository(GameRepository, DynamodbStorage):
             "turns-left": game.turns_left,
             "active-player": self._serialize_player(game.active_player),
             "passive-player": self._serialize_player(game.passive_player),
+            "active-index": game.active_index,
             "preferences": asdict(game.preferences),
             "trenches": list(game.trenches),
             self._ttl_key: self.get_expiration_time(),
@@ -33,11 +34,17 @@ class DynamodbGameRepository(GameRepository, DynamodbStorage):
         except KeyError:
             raise NoSuchGameException(game_id)
 
+        active_player = self._deserialize_player(serialized_game["active-player"])
+        passive_player = self._deserialize_player(serialized_game["passive-player"])
+        active_index = int(serialized_game.get("active-index", 0))
+
         return Game(
             id=serialized_game[self._key],
             turns_left=int(serialized_game["turns-left"]),
-            active_player=self._deserialize_player(serialized_game["active-player"]),
-            passive_player=self._deserialize_player(serialized_game["passive-player"]),
+            players=(active_player, passive_player)
+            if not active_index
+            else (passive_player, active_player),
+            active_index=active_index,
             preferences=GamePreferences(
                 **{
                     key: value
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from random import randint
+from random import randint, random
 from typing import Final, Iterable, cast
 
 from paper_tactics.entities.cell import Cell
@@ -15,18 +15,40 @@ class Game:
     id: Final[str] = ""
     preferences: Final[GamePreferences] = field(default_factory=GamePreferences)
     turns_left: int = 0
-    active_player: Player = field(default_factory=Player)
-    passive_player: Player = field(default_factory=Player)
+    players: tuple[Player, Player] = field(default_factory=lambda: (Player(), Player()))
+    active_index: int = 0
     trenches: frozenset[Cell] = frozenset()
+    _trench_mask: int = field(default=0, init=False, compare=False, repr=False)
+    _version: int = field(default=0, init=False, compare=False, repr=False)
+    _view_cache: dict[str, tuple[tuple, GameView]] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        for player in self.players:
+            self._update_masks(player)
+        self._trench_mask = self.preferences.get_cell_mask(self.trenches)
+
+    @property
+    def active_player(self) -> Player:
+        return self.players[self.active_index]
+
+    @property
+    def passive_player(self) -> Player:
+        return self.players[self.active_index ^ 1]
 
     def init(self) -> None:
         assert self.active_player.id != self.passive_player.id
 
         self._init_players()
+        for player in self.players:
+            self._update_masks(player)
         self.trenches = frozenset(self._generate_trenches())
+        self._trench_mask = self.preferences.get_cell_mask(self.trenches)
         self._rebuild_reachable_set(self.active_player, self.passive_player)
         self._rebuild_reachable_set(self.passive_player, self.active_player)
         self.turns_left = self.preferences.turn_count
+        self._version += 1
 
     def get_view(self, player_id: str) -> GameView:
         assert player_id in (self.active_player.id, self.passive_player.id)
@@ -38,46 +60,39 @@ class Game:
             me = self.passive_player
             opponent = self.active_player
 
+        key = (
+            self._version,
+            me.is_gone,
+            me.is_defeated,
+            opponent.is_gone,
+            opponent.is_defeated,
+        )
+        cached = self._view_cache.get(player_id)
+        if cached and cached[0] == key:
+            return cached[1]
+
         if self.preferences.is_visibility_applied and me.can_win and opponent.can_win:
             opponent_units = opponent.units.intersection(me.visible_opponent)
             opponent_walls = opponent.walls.intersection(me.visible_opponent)
             trenches = self.trenches.intersection(me.visible_terrain)
 
-            visible_opponent = Player(
-                units=opponent_units,
-                walls=opponent_walls,
+            unit_mask = self.preferences.get_cell_mask(opponent_units)
+            wall_mask = self.preferences.get_cell_mask(opponent_walls)
+            neighbours = self._get_neighbour_mask(unit_mask, wall_mask)
+            opponent_reachable = self.preferences.get_cells(
+                neighbours & ~(unit_mask | wall_mask | me.wall_mask)
             )
-            self._rebuild_reachable_set(visible_opponent, me)
-            opponent_reachable = visible_opponent.reachable
         else:
             opponent_units = opponent.units
             opponent_walls = opponent.walls
             opponent_reachable = opponent.reachable
             trenches = self.trenches
 
-        return GameView(
-            id=self.id,
-            turns_left=self.turns_left,
-            my_turn=(me == self.active_player),
-            me=PlayerView(
-                units=cast(frozenset[Cell], me.units),
-                walls=cast(frozenset[Cell], me.walls),
-                reachable=cast(frozenset[Cell], me.reachable),
-                view_data=me.view_data.copy(),
-                is_gone=me.is_gone,
-                is_defeated=me.is_defeated,
-            ),
-            opponent=PlayerView(
-                units=cast(frozenset[Cell], opponent_units),
-                walls=cast(frozenset[Cell], opponent_walls),
-                reachable=cast(frozenset[Cell], opponent_reachable),
-                view_data=opponent.view_data.copy(),
-                is_gone=opponent.is_gone,
-                is_defeated=opponent.is_defeated,
-            ),
-            trenches=trenches,
-            preferences=self.preferences,
+        view = self._build_view(
+            me, opponent, opponent_units, opponent_walls, opponent_reachable, trenches
         )
+        self._view_cache[player_id] = key, view
+        return view
 
     def make_turn(self, player_id: str, cell: Cell) -> None:
         if (
@@ -93,78 +108,150 @@ class Game:
         self._decrement_turns()
 
     def _decrement_turns(self) -> None:
+        self._version += 1
         self.turns_left -= 1
         if not self.turns_left:
-            if self.preferences.is_deathmatch:
-                self.preferences.turn_count += 1
-            self.turns_left = self.preferences.turn_count
+            self._reset_turn_count()
             if self.preferences.is_against_bot:
-                game_bot = GameBot()
-                for _ in range(self.preferences.turn_count):
-                    if not self.passive_player.reachable:
-                        self.passive_player.is_defeated = True
-                        break
-                    cell = game_bot.make_turn(self.get_view(self.passive_player.id), self.turns_left)
-                    assert cell in self.passive_player.reachable, f"{cell} is an invalid turn"
-                    self._make_turn(cell, self.passive_player, self.active_player)
-                    self.turns_left -= 1
-                if self.preferences.is_deathmatch:
-                    self.preferences.turn_count += 1
-                self.turns_left = self.preferences.turn_count
+                self._run_bot_turns()
+                self._reset_turn_count()
             else:
-                self.active_player, self.passive_player = (
-                    self.passive_player,
-                    self.active_player,
-                )
+                self.active_index ^= 1
         if not self.active_player.reachable and not self.passive_player.is_defeated:
             self.active_player.is_defeated = True
 
+    def _reset_turn_count(self) -> None:
+        self.preferences.turn_count += self.preferences.is_deathmatch
+        self.turns_left = self.preferences.turn_count
+
+    def _run_bot_turns(self) -> None:
+        game_bot = GameBot()
+        for _ in range(self.preferences.turn_count):
+            if not self.passive_player.reachable:
+                self.passive_player.is_defeated = True
+                break
+            cell = game_bot.make_turn(self._get_bot_view(), self.turns_left)
+            assert cell in self.passive_player.reachable, f"{cell} is an invalid turn"
+            self._make_turn(cell, self.passive_player, self.active_player)
+            self.turns_left -= 1
+
+    def _get_bot_view(self) -> GameView:
+        if self.preferences.is_visibility_applied:
+            return self.get_view(self.passive_player.id)
+
+        bot = self.passive_player
+        opponent = self.active_player
+
+        return self._build_view(
+            bot,
+            opponent,
+            opponent.units,
+            opponent.walls,
+            opponent.reachable,
+            self.trenches,
+            snapshot=False,
+        )
+
+    def _build_view(
+        self,
+        me: Player,
+        opponent: Player,
+        opponent_units: Iterable[Cell],
+        opponent_walls: Iterable[Cell],
+        opponent_reachable: Iterable[Cell],
+        trenches: frozenset[Cell],
+        snapshot: bool = True,
+    ) -> GameView:
+        def cells(source: Iterable[Cell]) -> frozenset[Cell]:
+            if snapshot:
+                return frozenset(source)
+            # Only the bot skips the snapshot: it reads its view within the
+            # current turn, before any of these live sets are mutated again.
+            return cast(frozenset[Cell], source)
+
+        return GameView(
+            id=self.id,
+            turns_left=self.turns_left,
+            my_turn=(me == self.active_player),
+            me=PlayerView(
+                units=cells(me.units),
+                walls=cells(me.walls),
+                reachable=cells(me.reachable),
+                view_data=me.view_data,
+                is_gone=me.is_gone,
+                is_defeated=me.is_defeated,
+            ),
+            opponent=PlayerView(
+                units=cells(opponent_units),
+                walls=cells(opponent_walls),
+                reachable=cells(opponent_reachable),
+                view_data=opponent.view_data,
+                is_gone=opponent.is_gone,
+                is_defeated=opponent.is_defeated,
+            ),
+            trenches=trenches,
+            preferences=self.preferences,
+        )
+
     def _make_turn(self, cell: Cell, player: Player, opponent: Player) -> None:
-        if cell in opponent.units:
+        self._version += 1
+        bit = self.preferences.get_cell_bit(cell)
+        if bit & opponent.unit_mask:
             opponent.units.remove(cell)
+            opponent.unit_mask &= ~bit
             player.walls.add(cell)
+            player.wall_mask |= bit
             self._rebuild_reachable_set(opponent, player)
-        elif cell in self.trenches:
+        elif bit & self._trench_mask:
             player.walls.add(cell)
+            player.wall_mask |= bit
             opponent.reachable.discard(cell)
         else:
             player.units.add(cell)
-        self._rebuild_reachable_set(player, opponent)
+            player.unit_mask |= bit
+        player.reachable.discard(cell)
+        self._extend_reachable_set(bit, player, opponent)
 
     def _rebuild_reachable_set(self, player: Player, opponent: Player) -> None:
+        if self.preferences.is_visibility_applied:
+            visible_opponent = player.visible_opponent
+            visible_opponent &= opponent.units | opponent.walls
+            visible_opponent |= opponent.walls - self.trenches
+
         player.reachable.clear()
+        self._extend_reachable_set(player.unit_mask, player, opponent)
 
-        if self.preferences.is_visibility_applied:
-            player.visible_opponent = {
-                cell
-                for cell in player.visible_opponent
-                if cell in opponent.units or cell in opponent.walls
-            }.union(cell for cell in opponent.walls if cell not in self.trenches)
-
-        sources = player.units.copy()
-
-        while True:
-            new_sources = set()
-
-            for source in sources:
-                for cell in self.preferences.get_adjacent_cells(source):
-                    if self.preferences.is_visibility_applied:
-                        player.visible_opponent.add(cell)
-                        if cell in self.trenches:
-                            player.visible_terrain.add(cell)
-                            player.visible_terrain.add(
-                                self.preferences.get_symmetric_cell(cell)
-                            )
-                    if cell in sources:
-                        continue
-                    if cell in player.walls:
-                        new_sources.add(cell)
-                    elif cell not in opponent.walls and cell not in player.units:
-                        player.reachable.add(cell)
-            if not new_sources:
-                break
+    def _extend_reachable_set(
+        self, sources: int, player: Player, opponent: Player
+    ) -> None:
+        preferences = self.preferences
+        blocked = player.unit_mask | player.wall_mask | opponent.wall_mask
+        neighbours = self._get_neighbour_mask(sources, player.wall_mask)
 
-            sources.update(new_sources)
+        player.reachable.update(preferences.get_cells(neighbours & ~blocked))
+
+        if preferences.is_visibility_applied:
+            player.visible_opponent.update(preferences.get_cells(neighbours))
+            get_symmetric_cell = preferences.get_symmetric_cell
+            for cell in preferences.get_cells(neighbours & self._trench_mask):
+                player.visible_terrain.add(cell)
+                player.visible_terrain.add(get_symmetric_cell(cell))
+
+    def _get_neighbour_mask(self, sources: int, walls: int) -> int:
+        get_adjacent_mask = self.preferences.get_adjacent_mask
+        new_sources = sources
+        neighbours = 0
+
+        while new_sources:
+            neighbours |= get_adjacent_mask(new_sources)
+            sources |= new_sources
+            new_sources = neighbours & walls & ~sources
+
+        return neighbours
+
+    def _update_masks(self, player: Player) -> None:
+        player.unit_mask = self.preferences.get_cell_mask(player.units)
+        player.wall_mask = self.preferences.get_cell_mask(player.walls)
 
     def _init_players(self) -> None:
         edge = self.preferences.size
@@ -185,19 +272,15 @@ class Game:
         if not self.preferences.trench_density_percent:
             return
 
-        size = self.preferences.size
-        half = (size + 1) // 2
-
-        for x in range(size):
-            for y in range(half):
-                if (
-                    (y < half - 1 or x < half)
-                    and (x + 1, y + 1) not in self.active_player.units
-                    and (x + 1, y + 1) not in self.passive_player.units
-                    and randint(1, 100) <= self.preferences.trench_density_percent
-                ):
-                    yield x + 1, y + 1
-                    yield size - x, size - y
+        density = self.preferences.trench_density_percent / 100
+        get_cell_bit = self.preferences.get_cell_bit
+        get_symmetric_cell = self.preferences.get_symmetric_cell
+        bases = self.active_player.unit_mask | self.passive_player.unit_mask
+
+        for cell in self.preferences.half_board_cells:
+            if not get_cell_bit(cell) & bases and random() < density:
+                yield cell
+                yield get_symmetric_cell(cell)
 
 
 class IllegalTurnException(Exception):
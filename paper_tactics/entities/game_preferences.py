@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cache
 from typing import Iterable
 
 from paper_tactics.entities.cell import Cell
@@ -28,18 +29,91 @@ class GamePreferences:
             and 0 <= self.trench_density_percent <= 100
         )
 
+    @property
+    def half_board_cells(self) -> tuple[Cell, ...]:
+        return _get_half_board_cells(self.size)
+
     def is_valid_cell(self, cell: Cell) -> bool:
         x, y = cell
         return 1 <= x <= self.size and 1 <= y <= self.size
 
     def get_symmetric_cell(self, cell: Cell) -> Cell:
-        x, y = cell
-        s = self.size + 1
-        return s - x, s - y
+        return _get_symmetric_cells(self.size)[cell]
 
-    def get_adjacent_cells(self, cell: Cell) -> Iterable[Cell]:
-        x, y = cell
-        for x_ in (x - 1, x, x + 1):
-            for y_ in (y - 1, y, y + 1):
-                if self.is_valid_cell((x_, y_)) and (x_ != x or y_ != y):
-                    yield x_, y_
+    def get_adjacent_cells(self, cell: Cell) -> tuple[Cell, ...]:
+        return _get_adjacent_cells(self.size)[cell]
+
+    def get_cell_bit(self, cell: Cell) -> int:
+        return _get_cell_bits(self.size)[cell]
+
+    def get_cell_mask(self, cells: Iterable[Cell]) -> int:
+        cell_bits = _get_cell_bits(self.size)
+        mask = 0
+        for cell in cells:
+            mask |= cell_bits[cell]
+        return mask
+
+    def get_adjacent_mask(self, mask: int) -> int:
+        board, without_first_column, without_last_column = _get_board_masks(self.size)
+        horizontal = ((mask << 1) & without_first_column) | (
+            (mask >> 1) & without_last_column
+        )
+        vertical = mask | horizontal
+        return (horizontal | (vertical << self.size) | (vertical >> self.size)) & board
+
+    def get_cells(self, mask: int) -> Iterable[Cell]:
+        cells = _get_cells(self.size)
+        while mask:
+            lowest = mask & -mask
+            yield cells[lowest.bit_length() - 1]
+            mask ^= lowest
+
+
+@cache
+def _get_cells(size: int) -> tuple[Cell, ...]:
+    return tuple((x, y) for x in range(1, size + 1) for y in range(1, size + 1))
+
+
+@cache
+def _get_cell_bits(size: int) -> dict[Cell, int]:
+    return {cell: 1 << i for i, cell in enumerate(_get_cells(size))}
+
+
+@cache
+def _get_half_board_cells(size: int) -> tuple[Cell, ...]:
+    half = (size + 1) // 2
+    return tuple(
+        (x + 1, y + 1)
+        for x in range(size)
+        for y in range(half)
+        if y < half - 1 or x < half
+    )
+
+
+@cache
+def _get_symmetric_cells(size: int) -> dict[Cell, Cell]:
+    s = size + 1
+    return {(x, y): (s - x, s - y) for x, y in _get_cells(size)}
+
+
+@cache
+def _get_adjacent_cells(size: int) -> dict[Cell, tuple[Cell, ...]]:
+    return {
+        (x, y): tuple(
+            (x_, y_)
+            for x_ in (x - 1, x, x + 1)
+            for y_ in (y - 1, y, y + 1)
+            if 1 <= x_ <= size and 1 <= y_ <= size and (x_ != x or y_ != y)
+        )
+        for x, y in _get_cells(size)
+    }
+
+
+@cache
+def _get_board_masks(size: int) -> tuple[int, int, int]:
+    cell_bits = _get_cell_bits(size)
+    return (
+        sum(cell_bits.values()),
+        sum(bit for (x, y), bit in cell_bits.items() if y != 1),
+        sum(bit for (x, y), bit in cell_bits.items() if y != size),
+    )
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any
 
 from paper_tactics.entities.cell import Cell
 from paper_tactics.entities.player_view import PlayerView
@@ -7,6 +8,16 @@ from paper_tactics.entities.game_preferences import GamePreferences
 
 @dataclass(frozen=True)
 class GameView:
+    __slots__ = (
+        "id",
+        "turns_left",
+        "my_turn",
+        "me",
+        "opponent",
+        "trenches",
+        "preferences",
+    )
+
     id: str
     turns_left: int
     my_turn: bool
@@ -14,3 +25,10 @@ class GameView:
     opponent: PlayerView
     trenches: frozenset[Cell]
     preferences: GamePreferences
+
+    def __getstate__(self) -> list[Any]:
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state: list[Any]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
@@ -12,6 +12,8 @@ class Player:
     reachable: set[Cell] = field(default_factory=set)
     visible_opponent: set[Cell] = field(default_factory=set)
     visible_terrain: set[Cell] = field(default_factory=set)
+    unit_mask: int = field(default=0, init=False, compare=False, repr=False)
+    wall_mask: int = field(default=0, init=False, compare=False, repr=False)
     view_data: Final[dict[str, str]] = field(default_factory=dict)
     is_gone: bool = False
     is_defeated: bool = False
@@ -1,13 +1,23 @@
 from dataclasses import dataclass
+from typing import Any, Mapping
 
 from paper_tactics.entities.cell import Cell
 
 
 @dataclass(frozen=True)
 class PlayerView:
+    __slots__ = ("units", "walls", "reachable", "view_data", "is_gone", "is_defeated")
+
     units: frozenset[Cell]
     walls: frozenset[Cell]
     reachable: frozenset[Cell]
-    view_data: dict[str, str]
+    view_data: Mapping[str, str]
     is_gone: bool
     is_defeated: bool
+
+    def __getstate__(self) -> list[Any]:
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state: list[Any]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
@@ -19,7 +19,7 @@ def concede(
     except NoSuchGameException as e:
         return logger.log_exception(e)
 
-    for player in game.active_player, game.passive_player:
+    for player in game.players:
         if player.id == player_id:
             player.is_gone = True
 
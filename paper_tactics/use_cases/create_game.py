@@ -48,8 +48,7 @@ def create_game(
 
     game = Game(
         id=uuid4().hex,
-        active_player=active_player,
-        passive_player=passive_player,
+        players=(active_player, passive_player),
         preferences=preferences,
     )
 
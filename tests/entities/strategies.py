@@ -59,8 +59,7 @@ def games(draw, shallow=False, is_visibility_applied=None, is_against_bot=None)
     if shallow:
         game = Game(
             preferences=preferences,
-            active_player=Player("a"),
-            passive_player=Player("b"),
+            players=(Player("a"), Player("b")),
         )
     else:
         active_player = draw(players())
@@ -68,10 +67,12 @@ def games(draw, shallow=False, is_visibility_applied=None, is_against_bot=None)
         game = Game(
             preferences=preferences,
             id=draw(text(min_size=1)),
-            active_player=active_player,
-            passive_player=replace(passive_player, id="*" + active_player.id)
-            if active_player.id == passive_player.id
-            else passive_player,
+            players=(
+                active_player,
+                replace(passive_player, id="*" + active_player.id)
+                if active_player.id == passive_player.id
+                else passive_player,
+            ),
         )
 
     game.init()
@@ -1,3 +1,6 @@
+from copy import copy, deepcopy
+from pickle import dumps, loads
+
 from hypothesis import given
 
 from tests.entities.strategies import games
@@ -73,3 +76,58 @@ def test_invisible_cells_are_unreachable(game):
 def test_reachable_cells_are_visible(game):
     for player in game.active_player, game.passive_player:
         assert not player.reachable.difference(player.visible_opponent)
+
+
+@given(games())
+def test_cell_masks_match_cell_sets(game):
+    for player in game.active_player, game.passive_player:
+        assert player.unit_mask == game.preferences.get_cell_mask(player.units)
+        assert player.wall_mask == game.preferences.get_cell_mask(player.walls)
+
+
+@given(games(shallow=True))
+def test_view_is_reused_until_game_changes(game):
+    view = game.get_view(game.active_player.id)
+    assert game.get_view(game.active_player.id) is view
+
+    game.active_player.is_gone = True
+    assert game.get_view(game.active_player.id).me.is_gone
+
+
+@given(games())
+def test_reachable_cells_are_adjacent_to_units_or_connected_walls(game):
+    players = game.active_player, game.passive_player
+    for player, opponent in zip(players, reversed(players)):
+        sources = set(player.units)
+        queue = list(sources)
+        while queue:
+            for cell in game.preferences.get_adjacent_cells(queue.pop()):
+                if cell in player.walls and cell not in sources:
+                    sources.add(cell)
+                    queue.append(cell)
+        assert player.reachable == {
+            cell
+            for source in sources
+            for cell in game.preferences.get_adjacent_cells(source)
+            if cell not in player.units
+            and cell not in player.walls
+            and cell not in opponent.walls
+        }
+
+
+@given(games(shallow=True))
+def test_view_is_not_changed_by_later_turns(game):
+    view = game.get_view(game.active_player.id)
+    units = set(view.me.units)
+    reachable = set(view.me.reachable)
+    if game.active_player.can_win and game.passive_player.can_win:
+        game.make_turn(game.active_player.id, next(iter(game.active_player.reachable)))
+    assert view.me.units == units and view.me.reachable == reachable
+
+
+@given(games())
+def test_view_survives_copy_and_pickle(game):
+    view = game.get_view(game.active_player.id)
+    assert copy(view) == view
+    assert deepcopy(view) == view
+    assert loads(dumps(view)) == view
@@ -0,0 +1,15 @@
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from paper_tactics.entities.game_preferences import GamePreferences
+
+
+@given(integers(min_value=2, max_value=12))
+def test_adjacent_mask_matches_adjacent_cells(size):
+    preferences = GamePreferences(size=size)
+    for x in range(1, size + 1):
+        for y in range(1, size + 1):
+            cell = x, y
+            assert preferences.get_adjacent_mask(
+                preferences.get_cell_bit(cell)
+            ) == preferences.get_cell_mask(preferences.get_adjacent_cells(cell))